@@ -13,7 +13,12 @@ except Exception:
 class BaseDriver:
     """Simple Appium driver wrapper that loads capabilities from JSON."""
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        caps_overrides: Optional[dict] = None,
+        server_url: Optional[str] = None,
+    ):
         config_file = (
             Path(config_path)
             if config_path
@@ -22,8 +27,9 @@ class BaseDriver:
         with open(config_file, "r") as f:
             cfg = json.load(f)
 
-        server_url = cfg.get("server_url", "http://localhost:4723/wd/hub")
-        caps = cfg.get("caps", {})
+        server_url = server_url or cfg.get("server_url", "http://localhost:4723/wd/hub")
+        caps = dict(cfg.get("caps", {}))
+        caps.update(caps_overrides or {})
 
         if AppiumOptions is not None:
             opts = AppiumOptions()
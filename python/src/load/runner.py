@@ -0,0 +1,254 @@
+"""Load generator driving the chat AI journey concurrently across leased devices.
+
+Each journey reuses the `ChatPage` steps a test would run: send a uniquely tagged
+message with `send_message`, wait for its own bubble with `is_message_present`
+(echo latency), then wait for the AI reply bubble below it with `wait_for_reply`
+(response latency, the backend's time to answer; `--reply-id` narrows it to the
+app's reply-bubble resource-id). A journey whose reply timed out keeps its device
+until that reply lands (or another timeout passes), so the next journey on the
+device can't take it for its own. Every session is taken to the chat screen
+once when the pool is created (the app must already be logged in). Journeys
+arrive as a Poisson process at `--rate` per second, each leases one device session
+from the pool (waiting if all are busy), thinks for `--think-time`, and releases it.
+
+    python -m src.load.runner --journeys 50 --rate 2 --concurrency 4
+    # locally, against the stub server (python -m src.load.stub_server):
+    python -m src.load.runner --server-url http://127.0.0.1:4780 --devices stub-1,stub-2 --journeys 20 \
+        --reply-id ai_message
+"""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import List, Optional
+import argparse
+import json
+import queue
+import random
+import statistics
+import time
+import uuid
+
+from ..drivers.driver import BaseDriver
+from ..pages.chat_page import ChatPage
+from ..telemetry.report import percentile
+from ..utils import adb
+
+
+@dataclass
+class JourneyResult:
+    device: str
+    ok: bool
+    queued_s: float
+    send_s: float
+    echo_s: float
+    response_s: float
+    total_s: float
+    error: Optional[str] = None
+
+
+class DevicePool:
+    """One Appium session per device; journeys lease a session exclusively."""
+
+    def __init__(
+        self,
+        devices: List[str],
+        server_url: Optional[str] = None,
+        config_path: Optional[str] = None,
+        open_timeout: float = 10.0,
+        reply_id: Optional[str] = None,
+    ):
+        self.drivers: List[BaseDriver] = []
+        self._free: "queue.Queue" = queue.Queue()
+        try:
+            for i, device in enumerate(devices):
+                overrides = {"udid": device, "deviceName": device, "systemPort": 8200 + i}
+                d = BaseDriver(config_path, caps_overrides=overrides, server_url=server_url)
+                self.drivers.append(d)
+                chat = ChatPage(d.driver)
+                chat.reply_bubble_id = reply_id
+                if not open_chat(chat, open_timeout):
+                    raise RuntimeError(f"{device}: could not open the chat screen")
+                self._free.put((device, chat))
+        except Exception:
+            self.close()
+            raise
+
+    @contextmanager
+    def lease(self):
+        device, page = self._free.get()
+        try:
+            yield device, page
+        finally:
+            self._free.put((device, page))
+
+    def close(self) -> None:
+        for d in self.drivers:
+            d.quit()
+        self.drivers = []
+
+
+def open_chat(chat: ChatPage, timeout: float = 10.0) -> bool:
+    """Make sure `chat` is on the chat screen, opening it from Home if needed."""
+    if chat.find_input() is not None:
+        return True
+    chat.open_from_home()
+    end = time.time() + timeout
+    while time.time() < end:
+        if chat.find_input() is not None:
+            return True
+        time.sleep(0.5)
+    return False
+
+
+def run_journey(pool: DevicePool, arrived: float, message: str, think_time: float, timeout: float) -> JourneyResult:
+    with pool.lease() as (device, chat):
+        leased = time.perf_counter()
+        queued = leased - arrived
+        if think_time > 0:
+            time.sleep(random.expovariate(1.0 / think_time))
+        token = f"{message} {uuid.uuid4().hex[:8]}"
+        tag = token.split()[-1]
+        try:
+            start = time.perf_counter()
+            if not chat.send_message(token):
+                raise RuntimeError("send_message returned False")
+            sent = time.perf_counter()
+            if not chat.is_message_present(tag, timeout=timeout, poll=0.1):
+                raise TimeoutError(f"sent message not visible within {timeout}s")
+            echoed = time.perf_counter()
+            if chat.wait_for_reply(tag, timeout=timeout, poll=0.1) is None:
+                failed = time.perf_counter()
+                # let the late reply land before releasing the device
+                chat.wait_for_reply(tag, timeout=timeout, poll=0.5)
+                return JourneyResult(
+                    device, False, queued, 0.0, 0.0, 0.0, failed - arrived,
+                    f"TimeoutError: no AI reply within {timeout}s",
+                )
+            done = time.perf_counter()
+            return JourneyResult(device, True, queued, sent - start, echoed - sent, done - sent, done - arrived)
+        except Exception as ex:
+            now = time.perf_counter()
+            return JourneyResult(device, False, queued, 0.0, 0.0, 0.0, now - arrived, f"{type(ex).__name__}: {ex}")
+
+
+def run_load(
+    pool: DevicePool,
+    journeys: int,
+    rate: float,
+    concurrency: int,
+    think_time: float = 0.0,
+    message: str = "Hi AI, load",
+    timeout: float = 10.0,
+) -> dict:
+    """Run `journeys` journeys with Poisson arrivals at `rate`/s (0 = all at once) and summarize them."""
+    results: List[JourneyResult] = []
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = []
+        next_arrival = started
+        for _ in range(journeys):
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(
+                executor.submit(run_journey, pool, time.perf_counter(), message, think_time, timeout)
+            )
+            if rate > 0:
+                next_arrival += random.expovariate(rate)
+        results = [f.result() for f in futures]
+    return summarize(results, time.perf_counter() - started)
+
+
+def _distribution(values: List[float]) -> dict:
+    if not values:
+        return {}
+    ms = [v * 1000.0 for v in values]
+    return {
+        "mean_ms": statistics.fmean(ms),
+        "p50_ms": percentile(ms, 50),
+        "p90_ms": percentile(ms, 90),
+        "p95_ms": percentile(ms, 95),
+        "p99_ms": percentile(ms, 99),
+        "max_ms": max(ms),
+    }
+
+
+def summarize(results: List[JourneyResult], wall_s: float) -> dict:
+    ok = [r for r in results if r.ok]
+    return {
+        "journeys": len(results),
+        "succeeded": len(ok),
+        "failed": len(results) - len(ok),
+        "wall_s": wall_s,
+        "throughput_per_s": len(ok) / wall_s if wall_s > 0 else 0.0,
+        "response_latency": _distribution([r.response_s for r in ok]),
+        "send": _distribution([r.send_s for r in ok]),
+        "echo": _distribution([r.echo_s for r in ok]),
+        "queued": _distribution([r.queued_s for r in results]),
+        "end_to_end": _distribution([r.total_s for r in ok]),
+        "per_device": {d: sum(1 for r in ok if r.device == d) for d in sorted({r.device for r in results})},
+        "errors": sorted({r.error for r in results if r.error}),
+        "results": [asdict(r) for r in results],
+    }
+
+
+def format_summary(summary: dict) -> str:
+    lines = [
+        f"journeys: {summary['journeys']}  ok: {summary['succeeded']}  failed: {summary['failed']}",
+        f"wall: {summary['wall_s']:.1f}s  throughput: {summary['throughput_per_s']:.2f} journeys/s",
+    ]
+    for key in ("response_latency", "echo", "send", "queued", "end_to_end"):
+        d = summary[key]
+        if d:
+            lines.append(
+                f"{key:>16}: mean {d['mean_ms']:.0f}  p50 {d['p50_ms']:.0f}  p90 {d['p90_ms']:.0f}  "
+                f"p95 {d['p95_ms']:.0f}  p99 {d['p99_ms']:.0f}  max {d['max_ms']:.0f} ms"
+            )
+    lines.append("per device: " + ", ".join(f"{d}={n}" for d, n in summary["per_device"].items()))
+    lines += [f"error: {e}" for e in summary["errors"]]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", default=None, help="Capabilities JSON (default config/dev_caps.json)")
+    parser.add_argument("--server-url", default=None, help="Override server_url from the config")
+    parser.add_argument("--devices", default=None, help="Comma-separated device serials (default: all adb devices)")
+    parser.add_argument("--journeys", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=1.0, help="Journey arrivals per second (0 = all at once)")
+    parser.add_argument("--concurrency", type=int, default=None, help="Max in-flight journeys (default: #devices)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean think time per journey in seconds")
+    parser.add_argument("--message", default="Hi AI, load")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds to wait for the echo and for the AI reply")
+    parser.add_argument(
+        "--reply-id", default=None, help="Resource-id of the AI reply bubble (default: any non-status text)"
+    )
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the full summary as JSON")
+    args = parser.parse_args(argv)
+
+    devices = args.devices.split(",") if args.devices else adb.list_devices()
+    if not devices:
+        parser.error("no devices: pass --devices or connect one via adb")
+
+    pool = DevicePool(devices, server_url=args.server_url, config_path=args.config, reply_id=args.reply_id)
+    try:
+        summary = run_load(
+            pool,
+            journeys=args.journeys,
+            rate=args.rate,
+            concurrency=args.concurrency or len(devices),
+            think_time=args.think_time,
+            message=args.message,
+            timeout=args.timeout,
+        )
+    finally:
+        pool.close()
+
+    print(format_summary(summary))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""Minimal W3C WebDriver stub of the Castalk chat screen, for verifying the load runner locally.
+
+Supports just enough of the protocol for the `ChatPage` load journey: session
+create/delete, element lookup by UiAutomator `textContains`/class name, click, clear,
+send keys, the Enter key (`press_keycode` / `mobile: pressKey`) and page source.
+A submitted message is echoed as a bubble at once, with a "Delivered" status and a
+timestamp label under it and a typing indicator while the reply is pending; the AI
+reply bubble (resource-id `REPLY_ID`) follows after a configurable simulated
+backend delay.
+
+    python -m src.load.stub_server --port 4780 --reply-delay 0.3
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import quoteattr
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+INPUT_ID = "chat-input"
+USER_ID = "com.castalk.stub:id/user_message"
+REPLY_ID = "com.castalk.stub:id/ai_message"
+STATUS_ID = "com.castalk.stub:id/message_status"
+
+
+class StubSession:
+    def __init__(self, caps: dict):
+        self.caps = caps
+        self.typed = ""
+        # (visible_at, resource_id, text) for each submitted message and reply
+        self.messages: List[Tuple[float, str, str]] = []
+        self.elements: Dict[str, str] = {INPUT_ID: ""}
+
+
+class StubState:
+    def __init__(self, reply_delay: float = 0.3, jitter: float = 0.1):
+        self.reply_delay = reply_delay
+        self.jitter = jitter
+        self.sessions: Dict[str, StubSession] = {}
+        self.lock = threading.Lock()
+
+    def delay(self) -> float:
+        return max(0.0, random.gauss(self.reply_delay, self.jitter))
+
+
+def _visible(session: StubSession) -> List[Tuple[int, str, str]]:
+    """Bubbles shown so far in arrival order, as on screen: a late reply lands at the bottom."""
+    now = time.time()
+    shown = sorted(
+        (visible_at, i, resource_id, text)
+        for i, (visible_at, resource_id, text) in enumerate(session.messages)
+        if visible_at <= now
+    )
+    return [(i, resource_id, text) for _, i, resource_id, text in shown]
+
+
+def _text_view(resource_id: str, text: str) -> str:
+    return (
+        f'<android.widget.TextView class="android.widget.TextView" '
+        f"resource-id={quoteattr(resource_id)} text={quoteattr(text)} />"
+    )
+
+
+def _page_source(session: StubSession) -> str:
+    visible = _visible(session)
+    nodes = []
+    for _, resource_id, text in visible:
+        nodes.append(_text_view(resource_id, text))
+        if resource_id == USER_ID:
+            nodes.append(_text_view(STATUS_ID, "Delivered"))
+            nodes.append(_text_view(STATUS_ID, time.strftime("%H:%M")))
+    if len(visible) < len(session.messages):
+        nodes.append(_text_view(STATUS_ID, "AI is typing…"))
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><hierarchy>'
+        f"{''.join(nodes)}"
+        '<android.widget.EditText class="android.widget.EditText" text="Type Something" />'
+        "</hierarchy>"
+    )
+
+
+def _find(session: StubSession, using: str, value: str) -> List[str]:
+    if using == "class name" and value == "android.widget.EditText":
+        return [INPUT_ID]
+    m = re.search(r'textContains\("(.*)"\)', value) if using == "-android uiautomator" else None
+    if not m:
+        return []
+    fragment = m.group(1)
+    if fragment == "Type Something":
+        return [INPUT_ID]
+    found = []
+    for i, _, text in _visible(session):
+        if fragment in text:
+            eid = f"msg-{i}"
+            session.elements[eid] = text
+            found.append(eid)
+    return found
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    state: StubState
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, value=None, status: int = 200, error: Optional[str] = None):
+        payload = {"value": value}
+        if error:
+            payload = {"value": {"error": error, "message": error, "stacktrace": ""}}
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> dict:
+        n = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(n) or b"{}") if n else {}
+
+    def _session(self, parts: List[str]) -> Optional[StubSession]:
+        return self.state.sessions.get(parts[1]) if len(parts) > 1 else None
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if parts == ["status"]:
+            return self._reply({"ready": True, "message": "stub"})
+        session = self._session(parts)
+        if session is None:
+            return self._reply(status=404, error="invalid session id")
+        if parts[2:] == ["source"]:
+            return self._reply(_page_source(session))
+        if len(parts) == 5 and parts[2] == "element" and parts[4] == "text":
+            return self._reply(session.elements.get(parts[3], ""))
+        return self._reply(None)
+
+    def do_DELETE(self):
+        parts = self.path.strip("/").split("/")
+        if len(parts) == 2:
+            with self.state.lock:
+                self.state.sessions.pop(parts[1], None)
+        self._reply(None)
+
+    def do_POST(self):
+        parts = self.path.strip("/").split("/")
+        body = self._body()
+        if parts == ["session"]:
+            caps = body.get("capabilities", {}).get("alwaysMatch", {})
+            sid = uuid.uuid4().hex
+            with self.state.lock:
+                self.state.sessions[sid] = StubSession(caps)
+            return self._reply({"sessionId": sid, "capabilities": caps})
+
+        session = self._session(parts)
+        if session is None:
+            return self._reply(status=404, error="invalid session id")
+        tail = parts[2:]
+
+        if tail in (["element"], ["elements"]):
+            found = _find(session, body.get("using", ""), body.get("value", ""))
+            refs = [{ELEMENT_KEY: eid} for eid in found]
+            if tail == ["elements"]:
+                return self._reply(refs)
+            if not refs:
+                return self._reply(status=404, error="no such element")
+            return self._reply(refs[0])
+
+        if len(tail) == 3 and tail[0] == "element":
+            action = tail[2]
+            if action == "clear":
+                session.typed = ""
+            elif action == "value":
+                session.typed += body.get("text") or "".join(body.get("value", []))
+            return self._reply(None)
+
+        keycode = None
+        if tail == ["appium", "device", "press_keycode"]:
+            keycode = body.get("keycode")
+        elif tail == ["execute", "sync"] and body.get("script") == "mobile: pressKey":
+            keycode = (body.get("args") or [{}])[0].get("keycode")
+        if keycode == 66 and session.typed:
+            now = time.time()
+            session.messages.append((now, USER_ID, session.typed))
+            session.messages.append((now + self.state.delay(), REPLY_ID, f"AI reply #{len(session.messages) // 2}"))
+            session.typed = ""
+
+        return self._reply(None)
+
+
+def serve(host: str = "127.0.0.1", port: int = 4780, reply_delay: float = 0.3, jitter: float = 0.1) -> ThreadingHTTPServer:
+    """Create (but do not start) a stub server; call `serve_forever()` on the result."""
+    handler = type("BoundStubHandler", (StubHandler,), {"state": StubState(reply_delay, jitter)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4780)
+    parser.add_argument("--reply-delay", type=float, default=0.3, help="Mean seconds before the AI reply is visible")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Std-dev of the reply delay in seconds")
+    args = parser.parse_args(argv)
+    server = serve(args.host, args.port, args.reply_delay, args.jitter)
+    print(f"stub WebDriver server on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
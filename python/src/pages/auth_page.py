@@ -1,15 +1,21 @@
 from appium.webdriver.common.appiumby import AppiumBy
 from .base_page import BasePage
+from ..telemetry.recorder import timed
+from ..utils.image_locator import get_locator
 from typing import Optional
 import time
 
 
+SIGNIN_AFFORDANCE = 'new UiSelector().textContains("Sign in with email")'
+
+
 class AuthPage(BasePage):
     """Page object for Castalk auth screens.
 
     Provides resilient selectors and high-level actions used across tests.
     """
 
+    @timed
     def open_email_signin(self):
         # Try quick non-blocking checks first to avoid long waits when items aren't present
         try:
@@ -31,6 +37,7 @@ class AuthPage(BasePage):
         # Fallback to waiting click for cases where element may appear after scrolling
         return self.click(AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("Sign In")')
 
+    @timed
     def fill_credentials(self, email: str, password: str):
         # Prefer finding two EditText fields; else try placeholders
         els = self.driver.find_elements(AppiumBy.CLASS_NAME, "android.widget.EditText")
@@ -49,6 +56,7 @@ class AuthPage(BasePage):
         except Exception:
             pass
 
+    @timed
     def submit(self):
         # click bottom 'Sign In' if present, else click first clickable with 'Sign'
         # quick non-blocking attempt
@@ -83,20 +91,22 @@ class AuthPage(BasePage):
         except Exception:
             return None
 
-    def is_signin_affordance_present(self, timeout: int = 3) -> bool:
-        try:
-            return bool(self.wait.until(lambda d: d.find_elements(AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("Sign in with email")')))
-        except Exception:
-            return False
+    @timed
+    def is_signin_affordance_present(self, timeout: float = 3) -> bool:
+        return self.is_present(AppiumBy.ANDROID_UIAUTOMATOR, SIGNIN_AFFORDANCE, timeout=timeout)
 
-    def is_logged_in(self, timeout: int = 5) -> bool:
+    @timed
+    def is_signin_affordance_absent(self, timeout: float = 0) -> bool:
+        """True once the sign-in affordance is gone; returns immediately when already absent."""
+        return self.is_absent(AppiumBy.ANDROID_UIAUTOMATOR, SIGNIN_AFFORDANCE, timeout=timeout)
+
+    @timed
+    def is_logged_in(self, timeout: float = 5) -> bool:
         # best-effort: check for a known post-login element (app-specific)
         # Consumers may override or update this selector as app evolves.
-        try:
-            return bool(self.wait.until(lambda d: d.find_elements(AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().descriptionContains("home")')))
-        except Exception:
-            return False
+        return self.is_present(AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().descriptionContains("home")', timeout=timeout)
 
+    @timed
     def expect_error(self, text: Optional[str] = None, timeout: int = 5) -> bool:
         """Wait up to `timeout` seconds for an error message.
 
@@ -118,6 +128,7 @@ class AuthPage(BasePage):
             time.sleep(0.5)
         return False
 
+    @timed
     def click_biometric(self):
         """Try to click biometric affordance (fingerprint icon).
 
@@ -138,8 +149,10 @@ class AuthPage(BasePage):
                     return True
             except Exception:
                 continue
-        return False
+        # icon-only control without content description: match the stored template
+        return get_locator().tap(self.driver, "fingerprint")
 
+    @timed
     def click_google(self) -> bool:
         """Click 'Continue with Google' button if present."""
         try:
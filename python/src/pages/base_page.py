@@ -1,23 +1,39 @@
+from appium.webdriver.common.appiumby import AppiumBy
 from appium.webdriver.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from typing import Tuple, Any
+from contextlib import contextmanager
+from typing import Tuple, Any, Optional
+import time
+
+from ..telemetry.recorder import timed
+from ..utils.ui_helpers import uia_settings
+
+# UiAutomator2 settings for quick polling: don't block each lookup waiting for the
+# UI to go idle or for a selector to appear; the caller's timeout does the waiting.
+QUICK_LOOKUP_SETTINGS = {"waitForIdleTimeout": 0, "waitForSelectorTimeout": 0}
 
 
 class BasePage:
     def __init__(self, driver: WebDriver, timeout: int = 8):
         self.driver = driver
+        self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
+        self._quick_depth = 0
+        self._settings_baseline: Optional[dict] = None
 
+    @timed
     def find(self, by: By, locator: str):
         return self.wait.until(EC.presence_of_element_located((by, locator)))
 
+    @timed
     def click(self, by: By, locator: str):
         el = self.find(by, locator)
         el.click()
         return el
 
+    @timed
     def send_keys(self, by: By, locator: str, text: str):
         el = self.find(by, locator)
         el.clear()
@@ -61,3 +77,79 @@ class BasePage:
         wt = self.wait if timeout is None else WebDriverWait(self.driver, timeout)
         return wt.until(EC.presence_of_element_located((by, locator)))
 
+    @contextmanager
+    def quick_lookups(self):
+        """Apply `QUICK_LOOKUP_SETTINGS` for a block; nested uses don't touch the server again.
+
+        Wrap a sequence of `is_present` / `is_absent` / `find_elements` checks in one
+        block to pay the settings round-trips once. The settings to restore are read
+        once per page.
+        """
+        if self._quick_depth:
+            self._quick_depth += 1
+            try:
+                yield
+            finally:
+                self._quick_depth -= 1
+            return
+        if self._settings_baseline is None:
+            try:
+                self._settings_baseline = self.driver.get_settings() or {}
+            except Exception:
+                self._settings_baseline = {}
+        self._quick_depth = 1
+        try:
+            with uia_settings(self.driver, previous=self._settings_baseline, **QUICK_LOOKUP_SETTINGS):
+                yield
+        finally:
+            self._quick_depth = 0
+
+    @timed
+    def is_present(self, by: By, locator: str, timeout: Optional[float] = None, poll: float = 0.25) -> bool:
+        """Return True as soon as `locator` matches, False after `timeout` seconds.
+
+        `timeout` defaults to the page timeout; each poll is a non-blocking `find_elements`.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        end = time.monotonic() + timeout
+        with self.quick_lookups():
+            while True:
+                try:
+                    if self.driver.find_elements(by, locator):
+                        return True
+                except Exception:
+                    pass
+                if time.monotonic() >= end:
+                    return False
+                time.sleep(poll)
+
+    @timed
+    def is_absent(
+        self, by: By, locator: str, timeout: float = 0, stable_for: float = 0.3, poll: float = 0.1
+    ) -> bool:
+        """Return True once `locator` matches nothing for `stable_for` seconds in a row.
+
+        With the default `timeout=0` this is an immediate check plus the short stability
+        window, so a negative assertion costs milliseconds rather than a full wait.
+        Returns False if the element is still present after `timeout` seconds. Only an
+        empty `find_elements` result counts as absence; a lookup that raises (session or
+        UiAutomator2 error) proves nothing and restarts the stability window.
+        """
+        end = time.monotonic() + timeout + stable_for
+        absent_since = None
+        with self.quick_lookups():
+            while True:
+                try:
+                    absent = not self.driver.find_elements(by, locator)
+                except Exception:
+                    absent = False
+                now = time.monotonic()
+                if not absent:
+                    absent_since = None
+                elif absent_since is None:
+                    absent_since = now
+                if absent_since is not None and now - absent_since >= stable_for:
+                    return True
+                if now >= end:
+                    return False
+                time.sleep(poll)
@@ -1,15 +1,39 @@
 from appium.webdriver.common.appiumby import AppiumBy
 from .base_page import BasePage
-from typing import Optional
+from ..telemetry.recorder import timed
+from ..utils.image_locator import get_locator
+from typing import List, Optional, Tuple
+import re
 import time
+import xml.etree.ElementTree as ET
+
+# Labels rendered next to chat bubbles that are never a reply: timestamps
+# ("10:42", "10:42 PM", "2 min ago"), delivery status and typing indicators,
+# alone or combined ("Delivered · 10:42").
+_STATUS_TOKEN = (
+    r"(?:\d{1,2}:\d{2}(?::\d{2})?(?:\s*[ap]\.?m\.?)?"
+    r"|\d+\s*(?:s|sec|m|min|h|hr|hour)s?\s+ago|just now|today|yesterday"
+    r"|sending|sent|delivered|seen|read|failed|(?:\w+\s+(?:is|are)\s+)?typing)"
+)
+STATUS_TEXT = re.compile(rf"\W*{_STATUS_TOKEN}(?:\W+{_STATUS_TOKEN})*\W*", re.IGNORECASE)
 
 
 class ChatPage(BasePage):
     """Page object for the Chat screen and related actions.
 
     Provides resilient selectors and high-level actions used by chat tests.
+
+    Reply detection assumes the page source lists bubbles in display order, oldest
+    first (UiAutomator2 dumps the message list top to bottom), so a bubble after the
+    sent message arrived after it. Set `reply_bubble_id` to the resource-id of the AI
+    reply bubble (full "pkg:id/name" or just "name") when the build exposes one;
+    without it any TextView after the sent bubble that isn't a timestamp or status
+    label (`STATUS_TEXT`) counts as the reply.
     """
 
+    reply_bubble_id: Optional[str] = None
+
+    @timed
     def open_from_home(self) -> Optional[object]:
         """Try to open the chat screen from the app Home by tapping the chat icon.
 
@@ -29,6 +53,7 @@ class ChatPage(BasePage):
         except Exception:
             return None
 
+    @timed
     def find_input(self) -> Optional[object]:
         """Return the chat input element if found, else None."""
         try:
@@ -47,6 +72,7 @@ class ChatPage(BasePage):
             pass
         return None
 
+    @timed
     def send_message(self, text: str) -> bool:
         """Enter `text` into the chat input and submit. Returns True if a submit action was attempted."""
         inp = self.find_input()
@@ -88,7 +114,8 @@ class ChatPage(BasePage):
 
         return False
 
-    def is_message_present(self, text_fragment: str, timeout: int = 8) -> bool:
+    @timed
+    def is_message_present(self, text_fragment: str, timeout: int = 8, poll: float = 0.5) -> bool:
         end = time.time() + timeout
         while time.time() < end:
             try:
@@ -96,9 +123,59 @@ class ChatPage(BasePage):
                     return True
             except Exception:
                 pass
-            time.sleep(0.5)
+            time.sleep(poll)
         return False
 
+    def message_nodes(self) -> List[Tuple[str, str]]:
+        """(resource-id, text) of every TextView on screen in page-source order, from one dump."""
+        try:
+            root = ET.fromstring(self.driver.page_source)
+        except Exception:
+            return []
+        return [
+            (n.get("resource-id", ""), n.get("text")) for n in root.iter()
+            if n.get("class", n.tag) == "android.widget.TextView" and n.get("text")
+        ]
+
+    def _is_reply_bubble(self, resource_id: str) -> bool:
+        rid = self.reply_bubble_id
+        return not rid or resource_id == rid or resource_id.endswith(f"/{rid}")
+
+    def reply_after(self, sent: str) -> Optional[str]:
+        """Text of the first reply bubble below the last bubble containing `sent`, if shown yet.
+
+        Replies above the sent bubble (earlier conversation) are never returned.
+        """
+        nodes = self.message_nodes()
+        last = max((i for i, (_, text) in enumerate(nodes) if sent in text), default=None)
+        if last is None:
+            return None
+        for resource_id, text in nodes[last + 1:]:
+            if sent in text or STATUS_TEXT.fullmatch(text) or not self._is_reply_bubble(resource_id):
+                continue
+            return text
+        return None
+
+    @timed
+    def wait_for_reply(self, sent: str, timeout: float = 30, poll: float = 0.5) -> Optional[str]:
+        """Wait for the AI reply bubble below the sent message (see `reply_after`).
+
+        `sent` should be unique to this message (e.g. a random tag) so the sent bubble
+        is unambiguous. A reply to an earlier message that lands only after `sent` was
+        submitted can't be told apart on screen; callers reusing a screen should let
+        the previous reply arrive first. Returns the reply text, or None after
+        `timeout` seconds.
+        """
+        end = time.time() + timeout
+        while True:
+            reply = self.reply_after(sent)
+            if reply is not None:
+                return reply
+            if time.time() >= end:
+                return None
+            time.sleep(poll)
+
+    @timed
     def open_suggestions(self) -> bool:
         """Tap the '+' suggestion button. Returns True if clicked."""
         try:
@@ -114,14 +191,16 @@ class ChatPage(BasePage):
             return True
         except Exception:
             pass
-        return False
+        return get_locator().tap(self.driver, "plus")
 
+    @timed
     def is_suggestion_shown(self) -> bool:
         try:
             return bool(self.driver.find_elements(AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("Suggestion")'))
         except Exception:
             return False
 
+    @timed
     def open_report(self) -> bool:
         """Tap the report button/icon. Returns True if clicked."""
         try:
@@ -136,8 +215,9 @@ class ChatPage(BasePage):
             return True
         except Exception:
             pass
-        return False
+        return get_locator().tap(self.driver, "report")
 
+    @timed
     def is_report_dialog_shown(self) -> bool:
         try:
             return bool(self.driver.find_elements(AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("Report")') or self.driver.find_elements(AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().textContains("Reason")'))
@@ -0,0 +1,127 @@
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from . import recorder
+from .recorder import CaseRecord
+from .report import compare_runs, write_html
+from .store import TelemetryStore
+
+# user_properties key carrying a finished CaseRecord from the process that ran the
+# test (possibly an xdist worker) to the process that owns the store
+RECORD_PROPERTY = "telemetry_record"
+
+
+def add_options(parser) -> None:
+    group = parser.getgroup("telemetry", "run timing telemetry")
+    group.addoption("--no-telemetry", action="store_true", default=False, help="Do not record test/step timings")
+    group.addoption(
+        "--telemetry-db", default="results/telemetry.sqlite", help="SQLite telemetry store (relative to rootdir)"
+    )
+    group.addoption(
+        "--telemetry-report", default="results/telemetry.html", help="HTML regression report (relative to rootdir)"
+    )
+    group.addoption(
+        "--telemetry-window", type=int, default=10, help="Number of previous runs used as the regression baseline"
+    )
+
+
+def _is_xdist_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+class TelemetryPlugin:
+    """Records per-test and per-step timings into a `TelemetryStore` and reports regressions.
+
+    Steps come from `recorder.timed` / `recorder.step` calls made while a test runs;
+    fixtures attach device/profile/APK metadata through `recorder.annotate`.
+
+    The process running a test finishes its record in the teardown report and ships
+    it via `report.user_properties`. Only the main process (the xdist controller, or
+    the single pytest process) opens the store, so one pytest session is one run and
+    the report/terminal summary are produced once.
+    """
+
+    def __init__(self, db_path: Path, report_path: Path, window: int = 10, is_worker: bool = False):
+        self.db_path = db_path
+        self.report_path = report_path
+        self.window = window
+        self.is_worker = is_worker
+        self.store: Optional[TelemetryStore] = None
+        self.run_id: Optional[int] = None
+        self.comparisons = []
+
+    @classmethod
+    def from_config(cls, config) -> "TelemetryPlugin":
+        root = Path(str(config.rootpath))
+        return cls(
+            root / config.getoption("--telemetry-db"),
+            root / config.getoption("--telemetry-report"),
+            config.getoption("--telemetry-window"),
+            is_worker=_is_xdist_worker(config),
+        )
+
+    def pytest_sessionstart(self, session):
+        if self.is_worker:
+            return
+        self.store = TelemetryStore(self.db_path)
+        self.run_id = self.store.start_run()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        recorder.begin(item.nodeid, profile="default")
+        try:
+            yield
+        finally:
+            recorder.end()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        rec = recorder.current()
+        if rec is None:
+            return
+        rec.duration_ms += report.duration * 1000.0
+        if report.outcome != "passed" and rec.outcome == "passed":
+            rec.outcome = report.outcome
+        if report.when == "teardown":
+            # copy: the report shares its list with item.user_properties
+            report.user_properties = list(report.user_properties) + [(RECORD_PROPERTY, rec.to_dict())]
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_logreport(self, report):
+        if self.is_worker:
+            # leave the record on the report; xdist forwards it to the controller
+            return
+        props = getattr(report, "user_properties", None) or []
+        records = [v for k, v in props if k == RECORD_PROPERTY]
+        if not records:
+            return
+        # keep the record out of junitxml and other report consumers
+        report.user_properties = [(k, v) for k, v in props if k != RECORD_PROPERTY]
+        if self.store is not None:
+            for data in records:
+                self.store.add_record(self.run_id, CaseRecord.from_dict(data))
+
+    def pytest_sessionfinish(self, session):
+        if self.store is None:
+            return
+        self.comparisons = compare_runs(self.store, self.run_id, window=self.window)
+        write_html(self.report_path, self.run_id, self.store.run_meta(self.run_id), self.comparisons, self.window)
+        self.store.close()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        regressed = [c for c in self.comparisons if c.regressed]
+        if not regressed:
+            return
+        terminalreporter.section("telemetry regressions")
+        for c in regressed:
+            where = c.name if c.kind == "test" else f"{c.test} {c.name}"
+            terminalreporter.write_line(
+                f"{c.kind} {where} [{c.device}, {c.profile}]: "
+                f"median {c.baseline_median_ms:.0f} -> {c.median_ms:.0f} ms, "
+                f"p95 {c.baseline_p95_ms:.0f} -> {c.p95_ms:.0f} ms"
+            )
+        terminalreporter.write_line(f"report: {self.report_path}")
@@ -0,0 +1,103 @@
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from typing import Any, Dict, List, Optional
+import threading
+import time
+
+
+@dataclass
+class Step:
+    name: str
+    duration_ms: float
+    outcome: str
+
+
+@dataclass
+class CaseRecord:
+    """Timings collected while one test runs, plus the device/profile/APK it ran against."""
+
+    test: str
+    meta: Dict[str, Any] = field(default_factory=dict)
+    steps: List[Step] = field(default_factory=list)
+    duration_ms: float = 0.0
+    outcome: str = "passed"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CaseRecord":
+        data = dict(data)
+        data["steps"] = [Step(**s) for s in data.get("steps", [])]
+        return cls(**data)
+
+
+_lock = threading.Lock()
+_current: Optional[CaseRecord] = None
+
+
+def begin(test: str, **meta) -> CaseRecord:
+    global _current
+    _current = CaseRecord(test=test, meta=dict(meta))
+    return _current
+
+
+def end() -> Optional[CaseRecord]:
+    global _current
+    rec, _current = _current, None
+    return rec
+
+
+def current() -> Optional[CaseRecord]:
+    return _current
+
+
+def annotate(**meta) -> None:
+    """Attach metadata (device, profile, apk_version, ...) to the running test, if any."""
+    rec = _current
+    if rec is not None:
+        rec.meta.update({k: v for k, v in meta.items() if v is not None})
+
+
+def _record(name: str, started: float, outcome: str) -> None:
+    rec = _current
+    if rec is None:
+        return
+    with _lock:
+        rec.steps.append(Step(name, (time.perf_counter() - started) * 1000.0, outcome))
+
+
+@contextmanager
+def step(name: str):
+    """Time a block as a named step of the running test. No-op outside a test."""
+    if _current is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        _record(name, started, "error")
+        raise
+    _record(name, started, "ok")
+
+
+def timed(fn):
+    """Decorator recording each call of `fn` as a step named after its qualified name."""
+    name = fn.__qualname__
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _current is None:
+            return fn(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            _record(name, started, "error")
+            raise
+        _record(name, started, "ok")
+        return result
+
+    return wrapper
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+from html import escape
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import math
+import statistics
+import time
+
+from .store import TelemetryStore
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; `pct` in [0, 100]."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[k]
+
+
+@dataclass
+class Comparison:
+    kind: str
+    test: str
+    name: str
+    device: Optional[str]
+    profile: Optional[str]
+    samples: int
+    median_ms: float
+    p95_ms: float
+    baseline_samples: int
+    baseline_median_ms: float
+    baseline_p95_ms: float
+    regressed: bool
+
+    @property
+    def median_shift(self) -> float:
+        return _shift(self.median_ms, self.baseline_median_ms)
+
+    @property
+    def p95_shift(self) -> float:
+        return _shift(self.p95_ms, self.baseline_p95_ms)
+
+
+def _shift(value: float, base: float) -> float:
+    if not base or math.isnan(base):
+        return float("nan")
+    return (value - base) / base
+
+
+def compare_runs(
+    store: TelemetryStore,
+    run_id: int,
+    window: int = 10,
+    threshold: float = 0.2,
+    min_delta_ms: float = 50.0,
+    min_baseline: int = 3,
+) -> List[Comparison]:
+    """Compare this run's median/p95 per test and step against the previous `window` runs.
+
+    Samples are only compared within the same test, device and profile (see
+    `TelemetryStore.samples`). An entry is flagged when its median or p95 grew by
+    more than `threshold` (relative) *and* `min_delta_ms` (absolute), with at least
+    `min_baseline` baseline samples so one noisy run can't trigger it.
+    """
+    current = store.samples([run_id])
+    baseline = store.samples(store.previous_runs(run_id, window))
+    out: List[Comparison] = []
+    for key, values in current.items():
+        base = baseline.get(key, [])
+        med, p95 = statistics.median(values), percentile(values, 95)
+        b_med = statistics.median(base) if base else float("nan")
+        b_p95 = percentile(base, 95)
+        regressed = len(base) >= min_baseline and any(
+            v - b > min_delta_ms and v > b * (1 + threshold) for v, b in ((med, b_med), (p95, b_p95))
+        )
+        out.append(Comparison(*key, len(values), med, p95, len(base), b_med, b_p95, regressed))
+    out.sort(key=lambda c: (not c.regressed, c.kind != "test", -c.median_ms))
+    return out
+
+
+def _fmt_ms(v: float) -> str:
+    return "–" if math.isnan(v) else f"{v:.0f}"
+
+
+def _fmt_pct(v: float) -> str:
+    return "–" if math.isnan(v) else f"{v:+.0%}"
+
+
+def write_html(path: Path, run_id: int, meta: Dict[str, List[str]], rows: List[Comparison], window: int) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    regressed = sum(r.regressed for r in rows)
+    body = []
+    for r in rows:
+        cells = [
+            r.kind, r.test, r.name if r.kind == "step" else "", r.device or "", r.profile or "",
+            str(r.samples), _fmt_ms(r.median_ms), _fmt_ms(r.p95_ms),
+            str(r.baseline_samples), _fmt_ms(r.baseline_median_ms), _fmt_ms(r.baseline_p95_ms),
+            _fmt_pct(r.median_shift), _fmt_pct(r.p95_shift),
+        ]
+        cls = ' class="regressed"' if r.regressed else ""
+        body.append(f"<tr{cls}>" + "".join(f"<td>{escape(c)}</td>" for c in cells) + "</tr>")
+    meta_html = "".join(f"<li>{escape(k)}: {escape(', '.join(v) or '–')}</li>" for k, v in meta.items())
+    headers = [
+        "kind", "test", "step", "device", "profile", "n", "median ms", "p95 ms",
+        "baseline n", "baseline median", "baseline p95", "median shift", "p95 shift",
+    ]
+    html = f"""<!doctype html>
+<html><head><meta charset="utf-8"><title>Telemetry run {run_id}</title>
+<style>
+body {{ font-family: sans-serif; }}
+table {{ border-collapse: collapse; }}
+td, th {{ border: 1px solid #ccc; padding: 2px 6px; text-align: right; }}
+td:nth-child(-n+5) {{ text-align: left; }}
+tr.regressed {{ background: #fdd; }}
+</style></head><body>
+<h1>Telemetry run {run_id}</h1>
+<p>{time.strftime('%Y-%m-%d %H:%M:%S')} — {regressed} regression(s) vs previous {window} run(s)</p>
+<ul>{meta_html}</ul>
+<table><tr>{''.join(f'<th>{h}</th>' for h in headers)}</tr>
+{chr(10).join(body)}
+</table></body></html>
+"""
+    path.write_text(html, encoding="utf-8")
@@ -0,0 +1,92 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import sqlite3
+import time
+
+from .recorder import CaseRecord
+
+# (kind, test, name, device, profile)
+SampleKey = Tuple[str, str, str, Optional[str], Optional[str]]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    duration_ms REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    device TEXT,
+    profile TEXT,
+    apk_version TEXT
+);
+CREATE INDEX IF NOT EXISTS timings_run ON timings(run_id);
+CREATE INDEX IF NOT EXISTS timings_key ON timings(kind, test, name, device, profile);
+"""
+
+
+class TelemetryStore:
+    """SQLite store of per-test and per-step timings, one row per sample."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(_SCHEMA)
+
+    def start_run(self) -> int:
+        cur = self.conn.execute("INSERT INTO runs (started_at) VALUES (?)", (time.time(),))
+        self.conn.commit()
+        return cur.lastrowid
+
+    def add_record(self, run_id: int, rec: CaseRecord) -> None:
+        meta = (rec.meta.get("device"), rec.meta.get("profile"), rec.meta.get("apk_version"))
+        rows = [(run_id, rec.test, "test", rec.test, rec.duration_ms, rec.outcome) + meta]
+        rows += [(run_id, rec.test, "step", s.name, s.duration_ms, s.outcome) + meta for s in rec.steps]
+        self.conn.executemany("INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self.conn.commit()
+
+    def previous_runs(self, run_id: int, limit: int) -> List[int]:
+        cur = self.conn.execute(
+            "SELECT DISTINCT run_id FROM timings WHERE run_id < ? ORDER BY run_id DESC LIMIT ?",
+            (run_id, limit),
+        )
+        return [r[0] for r in cur.fetchall()]
+
+    def samples(self, run_ids: Iterable[int]) -> Dict[SampleKey, List[float]]:
+        """Successful durations grouped by (kind, test, name, device, profile) for the given runs.
+
+        Steps are keyed by the test that ran them, so a shared step such as
+        `BasePage.find` is only compared against the same test on the same device.
+        """
+        run_ids = list(run_ids)
+        out: Dict[SampleKey, List[float]] = {}
+        if not run_ids:
+            return out
+        marks = ",".join("?" * len(run_ids))
+        cur = self.conn.execute(
+            f"SELECT kind, test, name, device, profile, duration_ms FROM timings "
+            f"WHERE run_id IN ({marks}) AND outcome IN ('passed', 'ok')",
+            run_ids,
+        )
+        for kind, test, name, device, profile, ms in cur:
+            out.setdefault((kind, test, name, device, profile), []).append(ms)
+        return out
+
+    def run_meta(self, run_id: int) -> Dict[str, List[str]]:
+        meta: Dict[str, List[str]] = {}
+        for col in ("device", "profile", "apk_version"):
+            cur = self.conn.execute(
+                f"SELECT DISTINCT {col} FROM timings WHERE run_id = ? AND {col} IS NOT NULL ORDER BY 1",
+                (run_id,),
+            )
+            meta[col] = [r[0] for r in cur.fetchall()]
+        return meta
+
+    def close(self) -> None:
+        self.conn.close()
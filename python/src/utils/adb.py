@@ -1,5 +1,5 @@
 import subprocess
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 def _run_adb_cmd(args: List[str], device: Optional[str] = None) -> str:
@@ -25,17 +25,60 @@ def get_first_device() -> Optional[str]:
     return devs[0] if devs else None
 
 
-def get_wifi_state(device: Optional[str] = None) -> Optional[bool]:
-    """Return True if wifi_on == 1, False if 0, else None."""
-    out = _run_adb_cmd(["shell", "settings", "get", "global", "wifi_on"], device)
-    out = out.strip()
-    if out == "1":
+def _parse_setting_flag(value: str) -> Optional[bool]:
+    value = value.strip()
+    if value == "1":
         return True
-    if out == "0":
+    if value == "0":
         return False
     return None
 
 
+def get_wifi_state(device: Optional[str] = None) -> Optional[bool]:
+    """Return True if wifi_on == 1, False if 0, else None."""
+    out = _run_adb_cmd(["shell", "settings", "get", "global", "wifi_on"], device)
+    return _parse_setting_flag(out)
+
+
+def get_network_state(device: Optional[str] = None) -> Dict[str, Optional[bool]]:
+    """Return wifi and mobile data state with a single adb round-trip.
+
+    Values follow `get_wifi_state`: True/False, or None when unknown.
+    """
+    out = _run_adb_cmd(
+        ["shell", "settings get global wifi_on; settings get global mobile_data"], device
+    )
+    lines = out.splitlines() + ["", ""]
+    return {"wifi": _parse_setting_flag(lines[0]), "data": _parse_setting_flag(lines[1])}
+
+
+def set_network_state(
+    device: Optional[str] = None, wifi: Optional[bool] = None, data: Optional[bool] = None
+) -> None:
+    """Enable/disable wifi and mobile data in one adb call. None leaves a radio untouched."""
+    cmds = []
+    if wifi is not None:
+        cmds.append(f"svc wifi {'enable' if wifi else 'disable'}")
+    if data is not None:
+        cmds.append(f"svc data {'enable' if data else 'disable'}")
+    if cmds:
+        _run_adb_cmd(["shell", "; ".join(cmds)], device)
+
+
+def is_emulator(device: Optional[str]) -> bool:
+    return bool(device) and device.startswith("emulator-")
+
+
+def set_emulator_network(device: str, speed: str = "full", delay: str = "none") -> None:
+    """Apply an emulator network speed/latency profile (`adb emu network speed/delay`).
+
+    `speed` / `delay` accept the emulator console names (gsm, edge, umts, lte, full, none, ...)
+    or explicit values such as "14.4:80" / "150:550".
+    """
+    _run_adb_cmd(["emu", "network", "speed", speed], device)
+    _run_adb_cmd(["emu", "network", "delay", delay], device)
+
+
 def toggle_wifi(device: Optional[str] = None, enable: bool = True) -> None:
     cmd = "enable" if enable else "disable"
     _run_adb_cmd(["shell", "svc", "wifi", cmd], device)
@@ -43,3 +86,13 @@ def toggle_wifi(device: Optional[str] = None, enable: bool = True) -> None:
 
 def open_wifi_settings(device: Optional[str] = None) -> None:
     _run_adb_cmd(["shell", "am", "start", "-a", "android.settings.WIFI_SETTINGS"], device)
+
+
+def get_app_version(package: str, device: Optional[str] = None) -> Optional[str]:
+    """Return the installed versionName of `package`, or None if not installed."""
+    out = _run_adb_cmd(["shell", "dumpsys", "package", package], device)
+    for line in out.splitlines():
+        line = line.strip()
+        if line.startswith("versionName="):
+            return line.split("=", 1)[1]
+    return None
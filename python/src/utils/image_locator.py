@@ -0,0 +1,193 @@
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import hashlib
+
+import numpy as np
+from PIL import Image
+
+
+DEFAULT_TEMPLATE_DIR = Path(__file__).resolve().parents[2] / "assets" / "templates"
+
+
+def _to_gray(png: bytes) -> np.ndarray:
+    with Image.open(BytesIO(png)) as im:
+        return np.asarray(im.convert("L"), dtype=np.float32)
+
+
+def _downsample(img: np.ndarray, factor: int) -> np.ndarray:
+    """Block-mean downsample by an integer factor (one pyramid level)."""
+    if factor <= 1:
+        return img
+    h, w = img.shape[0] // factor * factor, img.shape[1] // factor * factor
+    return img[:h, :w].reshape(h // factor, factor, w // factor, factor).mean(axis=(1, 3))
+
+
+def _resize(img: np.ndarray, scale: float) -> np.ndarray:
+    """Nearest-neighbour resize; good enough for small icon templates."""
+    h = max(1, int(round(img.shape[0] * scale)))
+    w = max(1, int(round(img.shape[1] * scale)))
+    rows = np.minimum((np.arange(h) / scale).astype(int), img.shape[0] - 1)
+    cols = np.minimum((np.arange(w) / scale).astype(int), img.shape[1] - 1)
+    return img[rows[:, None], cols]
+
+
+def _integral(img: np.ndarray) -> np.ndarray:
+    return np.pad(img, ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+
+
+def _window_sums(ii: np.ndarray, h: int, w: int) -> np.ndarray:
+    return ii[h:, w:] - ii[:-h, w:] - ii[h:, :-w] + ii[:-h, :-w]
+
+
+def _prepare(image: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-image terms shared by every template/scale: spectrum and integral images."""
+    image = image.astype(np.float64)
+    return np.fft.rfft2(image), _integral(image), _integral(image * image)
+
+
+def _ncc(prepared, shape: Tuple[int, int], template: np.ndarray) -> np.ndarray:
+    spectrum, ii1, ii2 = prepared
+    H, W = shape
+    h, w = template.shape
+    if h > H or w > W:
+        return np.full((0, 0), -1.0, dtype=np.float64)
+    t = template.astype(np.float64) - template.mean()
+    t_norm = np.sqrt((t * t).sum())
+
+    num = np.fft.irfft2(spectrum * np.conj(np.fft.rfft2(t, s=(H, W))), s=(H, W))
+    num = num[: H - h + 1, : W - w + 1]
+
+    n = h * w
+    s1 = _window_sums(ii1, h, w)
+    s2 = _window_sums(ii2, h, w)
+    var = np.maximum(s2 - s1 * s1 / n, 0.0)
+    denom = np.sqrt(var) * t_norm
+    out = np.zeros_like(num)
+    np.divide(num, denom, out=out, where=denom > 1e-6)
+    return out
+
+
+def match_template(image: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """Normalized cross-correlation of `template` over every valid offset of `image`.
+
+    Numerator via FFT correlation, window statistics via integral images, so the
+    cost is independent of the template size. Returns scores in [-1, 1] with
+    shape (H - h + 1, W - w + 1).
+    """
+    return _ncc(_prepare(image), image.shape, template)
+
+
+class ImageLocator:
+    """Locate icon-only controls in a single screenshot by template matching.
+
+    Runs entirely client-side (NumPy + Pillow), independent of the Appium images
+    plugin. Matching is coarse-to-fine: every scale is searched on a downsampled
+    pyramid level, then the best candidate is refined at full resolution in a
+    small window around it. Hits are cached per screen fingerprint, so repeated
+    lookups on an unchanged screen skip the matching entirely; misses are not
+    cached, since the icon may still be rendering.
+    """
+
+    def __init__(
+        self,
+        template_dir: Optional[Path] = None,
+        threshold: float = 0.8,
+        scales: Tuple[float, ...] = (0.75, 0.875, 1.0, 1.125, 1.25, 1.5),
+        pyramid_factor: int = 4,
+    ):
+        self.template_dir = Path(template_dir) if template_dir else DEFAULT_TEMPLATE_DIR
+        self.threshold = threshold
+        self.scales = scales
+        self.pyramid_factor = pyramid_factor
+        self._templates: Dict[str, Optional[np.ndarray]] = {}
+        self._cache: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+    def template(self, name: str) -> Optional[np.ndarray]:
+        if name not in self._templates:
+            path = self.template_dir / f"{name}.png"
+            self._templates[name] = _to_gray(path.read_bytes()) if path.exists() else None
+        return self._templates[name]
+
+    @staticmethod
+    def fingerprint(screen: np.ndarray) -> str:
+        """Cheap screen identity: hash of a coarse, quantized thumbnail."""
+        thumb = _downsample(screen, max(1, min(screen.shape) // 32))
+        return hashlib.sha1((thumb // 16).astype(np.uint8).tobytes()).hexdigest()
+
+    def locate_in(self, screen: np.ndarray, name: str) -> Optional[Tuple[int, int]]:
+        """Return the (x, y) centre of template `name` in `screen`, or None."""
+        tpl = self.template(name)
+        if tpl is None:
+            return None
+        key = (self.fingerprint(screen), name)
+        if key in self._cache:
+            return self._cache[key]
+
+        # keep the smallest scaled template at least 4 px wide on the coarse level
+        f = max(1, min(self.pyramid_factor, int(min(tpl.shape) * min(self.scales)) // 4))
+        coarse = _downsample(screen, f)
+        prepared = _prepare(coarse)
+        best = (-1.0, 1.0, 0, 0)
+        for scale in self.scales:
+            t = _downsample(_resize(tpl, scale), f)
+            if min(t.shape) < 3:
+                continue
+            scores = _ncc(prepared, coarse.shape, t)
+            if scores.size == 0:
+                continue
+            y, x = np.unravel_index(np.argmax(scores), scores.shape)
+            if scores[y, x] > best[0]:
+                best = (float(scores[y, x]), scale, int(y) * f, int(x) * f)
+
+        result = None
+        if best[0] >= 0:
+            _, scale, y0, x0 = best
+            t = _resize(tpl, scale)
+            th, tw = t.shape
+            top, left = max(0, y0 - 2 * f), max(0, x0 - 2 * f)
+            roi = screen[top: y0 + th + 2 * f, left: x0 + tw + 2 * f]
+            scores = match_template(roi, t)
+            if scores.size:
+                y, x = np.unravel_index(np.argmax(scores), scores.shape)
+                if scores[y, x] >= self.threshold:
+                    result = (left + int(x) + tw // 2, top + int(y) + th // 2)
+                    self._cache[key] = result
+        return result
+
+    def locate(self, driver, name: str) -> Optional[Tuple[int, int]]:
+        """Take one screenshot from `driver` and locate template `name` in it."""
+        if self.template(name) is None:
+            return None
+        try:
+            screen = _to_gray(driver.get_screenshot_as_png())
+        except Exception:
+            return None
+        return self.locate_in(screen, name)
+
+    def tap(self, driver, name: str) -> bool:
+        """Tap the centre of template `name` if found. Returns True if tapped."""
+        pos = self.locate(driver, name)
+        if pos is None:
+            return False
+        try:
+            driver.execute_script("mobile: clickGesture", {"x": pos[0], "y": pos[1]})
+            return True
+        except Exception:
+            pass
+        try:
+            driver.tap([pos])
+            return True
+        except Exception:
+            return False
+
+
+_default_locator: Optional[ImageLocator] = None
+
+
+def get_locator() -> ImageLocator:
+    """Shared locator so templates and the fingerprint cache survive across page objects."""
+    global _default_locator
+    if _default_locator is None:
+        _default_locator = ImageLocator()
+    return _default_locator
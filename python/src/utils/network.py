@@ -0,0 +1,143 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import time
+import warnings
+
+from . import adb
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    """Radio state plus emulator speed/latency for a network condition.
+
+    `wifi` / `data` set to None leave the radio untouched. `speed` / `delay` are
+    only applied on emulators (see `adb.set_emulator_network`).
+    """
+
+    name: str
+    wifi: Optional[bool] = True
+    data: Optional[bool] = True
+    speed: str = "full"
+    delay: str = "none"
+
+
+PROFILES: Dict[str, NetworkProfile] = {
+    p.name: p
+    for p in [
+        NetworkProfile("online"),
+        NetworkProfile("offline", wifi=False, data=False),
+        NetworkProfile("wifi-only", wifi=True, data=False),
+        NetworkProfile("data-only", wifi=False, data=True),
+        NetworkProfile("lte", wifi=False, data=True, speed="lte", delay="none"),
+        NetworkProfile("3g", wifi=False, data=True, speed="umts", delay="umts"),
+        NetworkProfile("edge", wifi=False, data=True, speed="edge", delay="edge"),
+        NetworkProfile("gsm", wifi=False, data=True, speed="gsm", delay="gprs"),
+    ]
+}
+
+
+def get_profile(name: str) -> NetworkProfile:
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown network profile {name!r}, expected one of {sorted(PROFILES)}")
+
+
+def _matches(state: Dict[str, Optional[bool]], wifi: Optional[bool], data: Optional[bool]) -> bool:
+    return (wifi is None or state.get("wifi") == wifi) and (data is None or state.get("data") == data)
+
+
+def verify_state(
+    device: Optional[str], wifi: Optional[bool], data: Optional[bool], timeout: float = 5
+) -> Dict[str, Optional[bool]]:
+    """Poll `adb.get_network_state` until it reports the expected radios or raise RuntimeError."""
+    end = time.time() + timeout
+    while True:
+        state = adb.get_network_state(device)
+        if _matches(state, wifi, data):
+            return state
+        if time.time() >= end:
+            raise RuntimeError(f"{device}: network state {state} did not reach wifi={wifi} data={data}")
+        time.sleep(0.25)
+
+
+def apply_profile(device: Optional[str], profile: NetworkProfile) -> None:
+    """Apply `profile` to one device and wait until the radios report it.
+
+    Read `adb.get_network_state` first if the device must be restored afterwards;
+    this may raise after the radios were already changed.
+    """
+    adb.set_network_state(device, wifi=profile.wifi, data=profile.data)
+    if adb.is_emulator(device):
+        adb.set_emulator_network(device, speed=profile.speed, delay=profile.delay)
+    verify_state(device, profile.wifi, profile.data)
+
+
+def restore_profile(device: Optional[str], previous: Dict[str, Optional[bool]]) -> None:
+    """Restore radios and (on emulators) network speed/delay; both are attempted even if one fails.
+
+    Raises RuntimeError listing every part that could not be restored.
+    """
+    errors = []
+    try:
+        adb.set_network_state(device, wifi=previous.get("wifi"), data=previous.get("data"))
+    except Exception as ex:
+        errors.append(f"radios: {ex}")
+    if adb.is_emulator(device):
+        try:
+            adb.set_emulator_network(device)
+        except Exception as ex:
+            errors.append(f"emulator network: {ex}")
+    if errors:
+        raise RuntimeError(f"{device}: could not restore network ({'; '.join(errors)})")
+
+
+class NetworkCondition:
+    """Context manager applying a network profile to several devices concurrently.
+
+    Each device is driven from its own thread so adb round-trips overlap; the
+    previous radio state is restored on exit, even if a test failed. A failed
+    restore raises RuntimeError on exit, or is emitted as a warning when the block
+    is already raising, so a device left degraded never goes unnoticed.
+    """
+
+    def __init__(self, profile: NetworkProfile, devices: Optional[List[str]] = None):
+        self.profile = profile
+        self.devices = devices if devices is not None else adb.list_devices()
+        self._previous: Dict[str, Dict[str, Optional[bool]]] = {}
+
+    def _map(self, fn, devices: List[str]) -> List[Exception]:
+        if not devices:
+            return []
+        errors: List[Exception] = []
+        with ThreadPoolExecutor(max_workers=len(devices)) as pool:
+            futures = [pool.submit(fn, d) for d in devices]
+            for f in futures:
+                try:
+                    f.result()
+                except Exception as ex:
+                    errors.append(ex)
+        return errors
+
+    def __enter__(self) -> "NetworkCondition":
+        def _apply(device):
+            # record before touching anything so a partly applied device is still restored
+            self._previous[device] = adb.get_network_state(device)
+            apply_profile(device, self.profile)
+
+        errors = self._map(_apply, self.devices)
+        if errors:
+            self.__exit__(type(errors[0]), errors[0], None)
+            raise errors[0]
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        previous, self._previous = self._previous, {}
+        errors = self._map(lambda d: restore_profile(d, previous[d]), list(previous))
+        if not errors:
+            return
+        message = "; ".join(str(e) for e in errors)
+        if exc_type is None:
+            raise RuntimeError(message)
+        warnings.warn(message, RuntimeWarning)
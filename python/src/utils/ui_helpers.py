@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from typing import Optional
 
 from appium.webdriver.common.appiumby import AppiumBy
@@ -101,3 +102,37 @@ def simulate_fingerprint(driver, adb_fallback: bool = True) -> bool:
         return True
     except Exception:
         return False
+
+
+# Documented UiAutomator2 server defaults, used to restore keys that get_settings() doesn't report
+UIA2_DEFAULT_SETTINGS = {"waitForIdleTimeout": 10000, "waitForSelectorTimeout": 10000}
+
+
+@contextmanager
+def uia_settings(driver, previous: Optional[dict] = None, **settings):
+    """Temporarily apply UiAutomator2 settings (e.g. waitForIdleTimeout=0) and restore them on exit.
+
+    Every key that is set is restored: to `previous[key]` if given, else to the value
+    reported by `get_settings()`, else to `UIA2_DEFAULT_SETTINGS`. Keys with no known
+    value to restore are not applied. Passing `previous` saves the `get_settings()`
+    round-trip. Servers that don't support settings are left untouched.
+    """
+    restore = None
+    try:
+        current = dict(previous) if previous is not None else (driver.get_settings() or {})
+        restore = {k: current.get(k, UIA2_DEFAULT_SETTINGS.get(k)) for k in settings}
+        restore = {k: v for k, v in restore.items() if v is not None}
+        if restore:
+            driver.update_settings({k: settings[k] for k in restore})
+    except Exception:
+        restore = None
+    if not restore:
+        yield
+        return
+    try:
+        yield
+    finally:
+        try:
+            driver.update_settings(restore)
+        except Exception:
+            pass
@@ -8,11 +8,76 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
 from src.drivers.driver import BaseDriver
+from src.telemetry import recorder
+from src.telemetry.plugin import TelemetryPlugin, add_options as add_telemetry_options
+from src.utils import adb
+from src.utils.network import NetworkCondition, get_profile
+
+# versionName per (device, package), looked up once per session for telemetry records
+_APP_VERSIONS = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--network-profile",
+        default=None,
+        help="Network profile (see src/utils/network.py PROFILES) applied by the `network_condition` fixture",
+    )
+    add_telemetry_options(parser)
+
+
+def pytest_configure(config):
+    if not config.getoption("--no-telemetry"):
+        config.pluginmanager.register(TelemetryPlugin.from_config(config), "telemetry")
+
+
+def _app_version(device, package):
+    key = (device, package)
+    if key not in _APP_VERSIONS:
+        try:
+            _APP_VERSIONS[key] = adb.get_app_version(package, device)
+        except Exception:
+            _APP_VERSIONS[key] = None
+    return _APP_VERSIONS[key]
+
+
+def _device_of(drv):
+    """Serial of the device behind an Appium session, as reported in its capabilities."""
+    caps = getattr(drv, "capabilities", None) or {}
+    return caps.get("deviceUDID") or caps.get("udid") or caps.get("deviceName")
+
+
+@pytest.fixture(scope="function")
+def network_condition(request):
+    """Apply a network profile to the test's own device for the duration of the test.
+
+    The profile comes from `@pytest.mark.network("<profile>")` or `--network-profile`;
+    when neither is set the fixture is a no-op and yields None. Only the device behind
+    the `driver` session is touched, so xdist workers on other devices are unaffected.
+    """
+    marker = request.node.get_closest_marker("network")
+    name = marker.args[0] if marker and marker.args else request.config.getoption("--network-profile")
+    if not name:
+        yield None
+        return
+    profile = get_profile(name)
+    device = _device_of(request.getfixturevalue("driver"))
+    if not device:
+        # without a serial adb would pick (or refuse to pick) a device on its own
+        pytest.fail(f"Cannot apply network profile {name!r}: session capabilities report no device serial")
+    recorder.annotate(profile=name)
+    with NetworkCondition(profile, devices=[device]) as cond:
+        yield cond
 
 
 @pytest.fixture(scope="function")
 def driver():
-    d = BaseDriver()
+    with recorder.step("session.create"):
+        d = BaseDriver()
+    caps = getattr(d.driver, "capabilities", None) or {}
+    device = _device_of(d.driver)
+    package = caps.get("appPackage")
+    recorder.annotate(device=device, apk_version=_app_version(device, package) if package else None)
     try:
         yield d.driver
     finally:
@@ -24,4 +89,5 @@ def driver():
                     pass
         except Exception:
             pass
-        d.quit()
+        with recorder.step("session.quit"):
+            d.quit()
@@ -16,7 +16,7 @@ def test_login_success(driver):
     auth.submit()
 
     # verify sign-in affordance disappeared or a post-login element is visible
-    assert not auth.is_signin_affordance_present(timeout=10) or auth.is_logged_in(), "Login may have failed"
+    assert auth.is_signin_affordance_absent(timeout=10) or auth.is_logged_in(), "Login may have failed"
 
 
 def test_login_invalid_password(driver):
@@ -93,22 +93,24 @@ def test_google_oauth_flow_starts(driver):
 
     import time
     end = time.time() + 6
-    while time.time() < end:
-        try:
-            contexts = auth.driver.contexts
-        except Exception:
-            contexts = []
+    # one settings change for the whole polling loop instead of one per check
+    with auth.quick_lookups():
+        while time.time() < end:
+            try:
+                contexts = auth.driver.contexts
+            except Exception:
+                contexts = []
 
-        if any("WEBVIEW" in (c or "") for c in contexts):
-            break
+            if any("WEBVIEW" in (c or "") for c in contexts):
+                break
 
-        if auth.expect_error(timeout=1) or not auth.is_signin_affordance_present(timeout=1):
-            break
+            if auth.expect_error(timeout=1) or auth.is_signin_affordance_absent():
+                break
 
-        time.sleep(0.5)
+            time.sleep(0.5)
 
-    else:
-        pytest.fail("OAuth flow did not start (no WEBVIEW/context change)")
+        else:
+            pytest.fail("OAuth flow did not start (no WEBVIEW/context change)")
 
     try:
         auth.driver.back()
@@ -4,7 +4,8 @@ import os
 from src.pages.chat_page import ChatPage
 from src.utils.ui_helpers import clear_inputs
 
-
+# applies `--network-profile` (if given) to each chat test's own device
+pytestmark = pytest.mark.usefixtures("network_condition")
 
 
 def test_open_chat_from_home(driver):
@@ -0,0 +1,54 @@
+from xml.sax.saxutils import quoteattr
+
+from src.pages.chat_page import ChatPage
+
+
+class FakeSourceDriver:
+    """Serves a page source built from (resource-id, text) TextViews."""
+
+    def __init__(self, *nodes):
+        self.nodes = list(nodes)
+
+    @property
+    def page_source(self):
+        views = "".join(
+            f'<android.widget.TextView class="android.widget.TextView" resource-id={quoteattr(rid)} '
+            f"text={quoteattr(text)} />"
+            for rid, text in self.nodes
+        )
+        return f'<?xml version="1.0" encoding="UTF-8"?><hierarchy>{views}</hierarchy>'
+
+
+USER = "app:id/user_message"
+AI = "app:id/ai_message"
+STATUS = "app:id/message_status"
+
+
+def test_reply_after_ignores_status_labels_and_earlier_replies():
+    """Only a bubble below the sent one counts; timestamps, delivery status and typing don't."""
+    drv = FakeSourceDriver(
+        (USER, "hello abc123"),
+        (AI, "an earlier reply"),
+        (USER, "Hi AI def456"),
+        (STATUS, "Delivered"),
+        (STATUS, "10:42 PM"),
+        (STATUS, "AI is typing…"),
+    )
+    page = ChatPage(drv)
+    assert page.reply_after("def456") is None
+
+    drv.nodes.append((AI, "Sure, here you go"))
+    assert page.reply_after("def456") == "Sure, here you go"
+    assert page.reply_after("zzz999") is None
+
+
+def test_reply_after_uses_reply_bubble_id():
+    """With `reply_bubble_id` set, other TextViews below the sent bubble are skipped."""
+    drv = FakeSourceDriver((USER, "Hi AI def456"), ("app:id/banner", "New feature!"), (AI, "Hello"))
+    page = ChatPage(drv)
+    assert page.reply_after("def456") == "New feature!"
+
+    page.reply_bubble_id = "ai_message"
+    assert page.reply_after("def456") == "Hello"
+    page.reply_bubble_id = AI
+    assert page.reply_after("def456") == "Hello"
@@ -0,0 +1,79 @@
+import numpy as np
+
+from src.utils.image_locator import ImageLocator, _resize, match_template
+
+
+def _icon(size: int) -> np.ndarray:
+    yy, xx = np.mgrid[:size, :size]
+    r = size / 2
+    disc = ((yy - r) ** 2 + (xx - r) ** 2 < (0.8 * r) ** 2) * 180.0
+    stripes = ((xx * 4 // size) % 2) * 60.0
+    return (disc + stripes).astype(np.float32)
+
+
+def _screen(shape=(800, 480), seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(120, 8, shape).astype(np.float32)
+
+
+def _locator(name: str, template: np.ndarray, **kwargs) -> ImageLocator:
+    loc = ImageLocator(template_dir="/nonexistent", **kwargs)
+    loc._templates[name] = template
+    return loc
+
+
+def test_match_template_equals_brute_force_ncc():
+    """FFT/integral-image NCC matches a direct per-offset computation."""
+    rng = np.random.default_rng(1)
+    image = rng.normal(100, 20, (40, 50))
+    tpl = rng.normal(100, 20, (7, 9))
+    scores = match_template(image, tpl)
+
+    t = tpl - tpl.mean()
+    expected = np.empty((40 - 7 + 1, 50 - 9 + 1))
+    for y in range(expected.shape[0]):
+        for x in range(expected.shape[1]):
+            w = image[y:y + 7, x:x + 9]
+            w = w - w.mean()
+            expected[y, x] = (w * t).sum() / np.sqrt((w * w).sum() * (t * t).sum())
+
+    assert scores.shape == expected.shape
+    assert np.abs(scores - expected).max() < 1e-6
+
+
+def test_locate_in_finds_scaled_icon():
+    """An icon drawn at 1.25x template size is found at its centre."""
+    icon = _icon(48)
+    big = _resize(icon, 1.25)
+    screen = _screen()
+    screen[500:500 + big.shape[0], 200:200 + big.shape[1]] = big
+
+    pos = _locator("icon", icon).locate_in(screen, "icon")
+
+    assert pos is not None
+    cx, cy = 200 + big.shape[1] // 2, 500 + big.shape[0] // 2
+    assert abs(pos[0] - cx) <= 2 and abs(pos[1] - cy) <= 2
+
+
+def test_locate_in_small_template():
+    """Templates too small for the default pyramid level are still searched."""
+    icon = _icon(10)
+    screen = _screen()
+    screen[300:310, 100:110] = icon
+
+    pos = _locator("tiny", icon, scales=(1.0,)).locate_in(screen, "tiny")
+
+    assert pos is not None
+    assert abs(pos[0] - 105) <= 1 and abs(pos[1] - 305) <= 1
+
+
+def test_locate_in_does_not_cache_misses():
+    """A miss on a screen is retried once the icon appears, even if the fingerprint is unchanged."""
+    icon = _icon(12)
+    screen = _screen()
+    loc = _locator("late", icon, scales=(1.0,))
+    loc.fingerprint = lambda _screen: "same-screen"
+    assert loc.locate_in(screen, "late") is None
+
+    rendered = screen.copy()
+    rendered[600:612, 400:412] = icon
+    assert loc.locate_in(rendered, "late") is not None
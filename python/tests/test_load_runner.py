@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from src.load import runner, stub_server
+
+
+@pytest.fixture
+def stub():
+    """Stub WebDriver server on an ephemeral port, served from a background thread."""
+    server = stub_server.serve(port=0, reply_delay=0.2, jitter=0.0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _url(server) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def test_run_load_against_stub(stub):
+    """Every journey completes and response latency reflects the stub's reply delay."""
+    pool = runner.DevicePool(["stub-1", "stub-2"], server_url=_url(stub))
+    try:
+        summary = runner.run_load(pool, journeys=10, rate=0, concurrency=2, timeout=5)
+    finally:
+        pool.close()
+
+    assert summary["journeys"] == 10
+    assert summary["succeeded"] == 10, summary["errors"]
+    assert summary["throughput_per_s"] > 0
+    assert set(summary["per_device"]) == {"stub-1", "stub-2"}
+
+    resp = summary["response_latency"]
+    assert resp["p50_ms"] <= resp["p95_ms"] <= resp["p99_ms"] <= resp["max_ms"]
+    # replies are delayed 200 ms by the stub; the echo is immediate
+    assert 200 <= resp["p50_ms"] < 1000
+    assert summary["echo"]["p50_ms"] < resp["p50_ms"]
+
+
+def test_device_pool_quits_sessions_when_setup_fails(stub, monkeypatch):
+    """Sessions created before a failing device are closed, not leaked."""
+    opened = iter([True, False])
+    monkeypatch.setattr(runner, "open_chat", lambda chat, timeout: next(opened))
+
+    with pytest.raises(RuntimeError, match="stub-2"):
+        runner.DevicePool(["stub-1", "stub-2"], server_url=_url(stub))
+
+    assert stub.RequestHandlerClass.state.sessions == {}
+
+
+def test_late_reply_not_credited_to_next_journey():
+    """A reply arriving after its journey timed out doesn't complete the next journey on that device."""
+    server = stub_server.serve(port=0, reply_delay=0.5, jitter=0.0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        pool = runner.DevicePool(["stub-1"], server_url=_url(server), reply_id="ai_message")
+        try:
+            summary = runner.run_load(pool, journeys=2, rate=0, concurrency=1, timeout=0.4)
+        finally:
+            pool.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert summary["succeeded"] == 0
+    assert summary["errors"] == ["TimeoutError: no AI reply within 0.4s"]
@@ -0,0 +1,94 @@
+import pytest
+
+from src.utils import adb, network
+
+
+class FakeAdb:
+    """In-memory stand-in for `adb._run_adb_cmd` tracking radios and emulator network per device."""
+
+    def __init__(self, devices, misreport=(), fail_enable=()):
+        self.state = {d: {"wifi": True, "data": True, "speed": "full", "delay": "none"} for d in devices}
+        self.misreport = set(misreport)  # devices whose settings always read back as "on"
+        self.fail_enable = set(fail_enable)  # devices where `svc ... enable` errors
+        self.calls = []
+
+    def __call__(self, args, device=None):
+        self.calls.append((device, args))
+        st = self.state[device]
+        if args[:1] == ["emu"]:
+            st[args[2]] = args[3]
+            return "OK"
+        cmd = args[1]
+        if cmd.startswith("settings get"):
+            if device in self.misreport:
+                return "1\n1"
+            return f"{int(st['wifi'])}\n{int(st['data'])}"
+        for part in cmd.split("; "):
+            _, radio, action = part.split()
+            if action == "enable" and device in self.fail_enable:
+                raise RuntimeError(f"adb failed: {part}")
+            st[radio] = action == "enable"
+        return ""
+
+
+@pytest.fixture
+def fake_adb(monkeypatch):
+    def install(*args, **kwargs):
+        fake = FakeAdb(*args, **kwargs)
+        monkeypatch.setattr(adb, "_run_adb_cmd", fake)
+        # don't poll for the full 5 s when a device never reaches the expected state
+        monkeypatch.setattr(network.verify_state, "__defaults__", (0,))
+        return fake
+
+    return install
+
+
+def test_profile_applied_verified_and_restored(fake_adb):
+    """Radios and emulator speed/delay are set inside the block and restored after it."""
+    fake = fake_adb(["emulator-5554", "R58M"])
+    with network.NetworkCondition(network.get_profile("edge"), ["emulator-5554", "R58M"]):
+        assert fake.state["emulator-5554"] == {"wifi": False, "data": True, "speed": "edge", "delay": "edge"}
+        # physical devices only get the radio changes
+        assert fake.state["R58M"] == {"wifi": False, "data": True, "speed": "full", "delay": "none"}
+        # both radios set in one call, then read back to verify
+        r58m = [args for dev, args in fake.calls if dev == "R58M"]
+        assert r58m[-2:] == [
+            ["shell", "svc wifi disable; svc data enable"],
+            ["shell", "settings get global wifi_on; settings get global mobile_data"],
+        ]
+
+    for st in fake.state.values():
+        assert st == {"wifi": True, "data": True, "speed": "full", "delay": "none"}
+
+
+def test_partly_applied_device_restored_when_enter_fails(fake_adb):
+    """A device whose radios changed but never verifies raises, and is still restored."""
+    fake = fake_adb(["e1", "e2"], misreport=["e2"])
+
+    with pytest.raises(RuntimeError, match="e2: network state"):
+        with network.NetworkCondition(network.get_profile("offline"), ["e1", "e2"]):
+            pass
+
+    assert fake.state["e1"]["wifi"] is True and fake.state["e1"]["data"] is True
+    assert fake.state["e2"]["wifi"] is True and fake.state["e2"]["data"] is True
+
+
+def test_failed_restore_is_reported(fake_adb):
+    """If restoring a device fails, leaving the block raises and the emulator network is still reset."""
+    fake = fake_adb(["emulator-5554"], fail_enable=["emulator-5554"])
+    # both radios off so only the restore needs `svc ... enable`
+    profile = network.NetworkProfile("gsm-offline", wifi=False, data=False, speed="gsm", delay="gprs")
+    with pytest.raises(RuntimeError, match="could not restore network"):
+        with network.NetworkCondition(profile, ["emulator-5554"]):
+            assert fake.state["emulator-5554"]["speed"] == "gsm"
+    st = fake.state["emulator-5554"]
+    assert (st["speed"], st["delay"]) == ("full", "none")
+
+
+def test_failed_restore_warns_when_block_raises(fake_adb):
+    """A restore failure doesn't mask the test's own error; it is emitted as a warning."""
+    fake_adb(["R58M"], fail_enable=["R58M"])
+    with pytest.warns(RuntimeWarning, match="could not restore network"):
+        with pytest.raises(KeyError):
+            with network.NetworkCondition(network.get_profile("offline"), ["R58M"]):
+                raise KeyError("test failure")
@@ -0,0 +1,164 @@
+import os
+import sqlite3
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from src.telemetry.recorder import CaseRecord, Step
+from src.telemetry.report import compare_runs, percentile
+from src.telemetry.store import TelemetryStore
+
+pytest_plugins = "pytester"
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = TelemetryStore(tmp_path / "telemetry.sqlite")
+    yield s
+    s.close()
+
+
+def _record(test="t", ms=1000.0, device="dev1", profile="default", outcome="passed", steps=()):
+    return CaseRecord(test, {"device": device, "profile": profile}, [Step(*s) for s in steps], ms, outcome)
+
+
+def _run(store, *records):
+    run_id = store.start_run()
+    for rec in records:
+        store.add_record(run_id, rec)
+    return run_id
+
+
+def _test_row(rows, test="t"):
+    (row,) = [c for c in rows if c.kind == "test" and c.test == test]
+    return row
+
+
+def test_percentile_nearest_rank():
+    """Nearest-rank percentiles pick an observed value; empty input is NaN."""
+    values = [5, 1, 4, 2, 3]
+    assert percentile(values, 0) == 1
+    assert percentile(values, 50) == 3
+    assert percentile(values, 95) == 5
+    assert percentile(values, 100) == 5
+    assert percentile(list(range(1, 101)), 90) == 90
+    assert percentile([], 50) != percentile([], 50)
+
+
+def test_samples_grouped_by_test_device_and_profile(store):
+    """A shared step is grouped per test/device/profile; failed samples are left out."""
+    run_id = _run(
+        store,
+        _record("a", 100, "dev1", steps=[("BasePage.find", 10, "ok"), ("BasePage.find", 12, "ok")]),
+        _record("a", 200, "dev2", steps=[("BasePage.find", 20, "ok")]),
+        _record("b", 300, "dev1", "3g", steps=[("BasePage.find", 30, "ok"), ("BasePage.click", 99, "error")]),
+        _record("c", 400, "dev1", outcome="failed"),
+    )
+    assert store.samples([run_id]) == {
+        ("test", "a", "a", "dev1", "default"): [100],
+        ("step", "a", "BasePage.find", "dev1", "default"): [10, 12],
+        ("test", "a", "a", "dev2", "default"): [200],
+        ("step", "a", "BasePage.find", "dev2", "default"): [20],
+        ("test", "b", "b", "dev1", "3g"): [300],
+        ("step", "b", "BasePage.find", "dev1", "3g"): [30],
+    }
+
+
+def test_compare_runs_flags_relative_and_absolute_regression(store):
+    """A 30 % / 300 ms slower median against three baseline runs is flagged."""
+    for ms in (1000, 990, 1010):
+        _run(store, _record(ms=ms))
+    run_id = _run(store, _record(ms=1300))
+
+    row = _test_row(compare_runs(store, run_id))
+    assert row.regressed
+    assert row.baseline_samples == 3 and row.baseline_median_ms == 1000
+    assert row.median_shift == pytest.approx(0.3)
+
+
+@pytest.mark.parametrize(
+    "baseline, current, kwargs",
+    [
+        ((1000, 990, 1010), 1100, {}),  # +10 %: below threshold
+        ((100, 100, 100), 140, {}),  # +40 % but only 40 ms: below min_delta_ms
+        ((1000, 1000), 2000, {}),  # doubled, but only two baseline samples
+        ((1000, 990, 1010), 1300, {"threshold": 0.5}),
+        ((1000, 990, 1010), 1300, {"min_delta_ms": 500}),
+    ],
+)
+def test_compare_runs_does_not_flag_below_limits(store, baseline, current, kwargs):
+    """Small, noisy or poorly sampled shifts are reported but not flagged."""
+    for ms in baseline:
+        _run(store, _record(ms=ms))
+    run_id = _run(store, _record(ms=current))
+    assert not _test_row(compare_runs(store, run_id, **kwargs)).regressed
+
+
+def test_compare_runs_baseline_limited_to_window_and_same_device(store):
+    """Runs older than the window, or from another device, are not part of the baseline."""
+    for _ in range(3):
+        _run(store, _record(ms=100))  # old, fast runs outside the window
+    for _ in range(3):
+        _run(store, _record(ms=1000), _record(ms=100, device="dev2"))
+    run_id = _run(store, _record(ms=1000), _record(ms=1000, device="dev2"))
+
+    rows = compare_runs(store, run_id, window=3)
+    dev1 = [r for r in rows if r.kind == "test" and r.device == "dev1"]
+    dev2 = [r for r in rows if r.kind == "test" and r.device == "dev2"]
+    assert not dev1[0].regressed and dev1[0].baseline_samples == 3
+    assert dev2[0].regressed
+
+
+_PLUGIN_CONFTEST = f"""
+import sys
+sys.path.insert(0, {ROOT!r})
+
+from src.telemetry.plugin import TelemetryPlugin, add_options
+
+
+def pytest_addoption(parser):
+    add_options(parser)
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(TelemetryPlugin.from_config(config), "telemetry")
+"""
+
+_TESTS = """
+import pytest
+from src.telemetry import recorder
+
+
+@pytest.mark.parametrize("i", range(4))
+def test_step(i):
+    recorder.annotate(device=f"dev{i % 2}")
+    with recorder.step("work"):
+        pass
+"""
+
+
+@pytest.mark.parametrize("xdist_args", [[], ["-n", "2"]], ids=["single", "xdist"])
+def test_plugin_records_one_run_per_session(pytester, xdist_args):
+    """With or without xdist, a session is one run holding every test; junitxml stays clean."""
+    pytester.makeconftest(_PLUGIN_CONFTEST)
+    pytester.makepyfile(test_sample=_TESTS)
+
+    result = pytester.runpytest_subprocess(*xdist_args, "--junitxml=results/junit.xml")
+    result.assert_outcomes(passed=4)
+
+    conn = sqlite3.connect(str(pytester.path / "results" / "telemetry.sqlite"))
+    try:
+        assert conn.execute("SELECT id FROM runs").fetchall() == [(1,)]
+        rows = conn.execute("SELECT run_id, kind, name, device FROM timings ORDER BY test, kind").fetchall()
+    finally:
+        conn.close()
+    assert len(rows) == 8
+    assert {r[0] for r in rows} == {1}
+    assert sorted(r[2] for r in rows if r[1] == "step") == ["work"] * 4
+    assert sorted(r[3] for r in rows) == ["dev0"] * 4 + ["dev1"] * 4
+
+    xml = ET.parse(str(pytester.path / "results" / "junit.xml"))
+    assert not [p for p in xml.iter("property") if p.get("name") == "telemetry_record"]
+    assert (pytester.path / "results" / "telemetry.html").exists()
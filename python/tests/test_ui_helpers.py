@@ -0,0 +1,77 @@
+import pytest
+
+from src.pages.base_page import BasePage
+from src.utils.ui_helpers import UIA2_DEFAULT_SETTINGS, uia_settings
+
+
+class FakeSettingsDriver:
+    """Records settings round-trips; `reported` is what get_settings() returns."""
+
+    def __init__(self, reported=None, fail=False, lookups=()):
+        self.settings = dict(UIA2_DEFAULT_SETTINGS)
+        self.reported = reported
+        self.fail = fail
+        self.lookups = list(lookups)  # find_elements results in order (exceptions are raised); then []
+        self.calls = []
+
+    def get_settings(self):
+        self.calls.append("get")
+        if self.fail:
+            raise RuntimeError("settings not supported")
+        return dict(self.reported) if self.reported is not None else dict(self.settings)
+
+    def update_settings(self, settings):
+        self.calls.append("update")
+        if self.fail:
+            raise RuntimeError("settings not supported")
+        self.settings.update(settings)
+
+    def find_elements(self, by, locator):
+        result = self.lookups.pop(0) if self.lookups else []
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def test_uia_settings_restores_keys_not_reported():
+    """Keys missing from get_settings() are restored to the UiAutomator2 defaults."""
+    drv = FakeSettingsDriver(reported={})
+    with uia_settings(drv, waitForIdleTimeout=0, waitForSelectorTimeout=0):
+        assert drv.settings == {"waitForIdleTimeout": 0, "waitForSelectorTimeout": 0}
+    assert drv.settings == UIA2_DEFAULT_SETTINGS
+
+
+def test_uia_settings_failure_does_not_chain_body_errors():
+    """Errors from the caller's block are not chained onto a settings failure."""
+    drv = FakeSettingsDriver(fail=True)
+    with pytest.raises(KeyError) as info:
+        with uia_settings(drv, waitForIdleTimeout=0):
+            raise KeyError("body")
+    assert info.value.__context__ is None
+
+
+def test_quick_lookups_applies_settings_once_per_block():
+    """Nested checks inside one quick_lookups block reuse the applied settings."""
+    drv = FakeSettingsDriver()
+    page = BasePage(drv)
+    with page.quick_lookups():
+        assert page.is_absent("id", "x", stable_for=0)
+        assert page.is_absent("id", "y", stable_for=0)
+    assert drv.calls == ["get", "update", "update"]
+
+    drv.calls.clear()
+    assert page.is_absent("id", "z", stable_for=0)
+    assert drv.calls == ["update", "update"]
+    assert drv.settings == UIA2_DEFAULT_SETTINGS
+
+
+def test_is_absent_does_not_count_lookup_errors_as_absence():
+    """A find_elements error is not evidence of absence; only empty results are."""
+    drv = FakeSettingsDriver(lookups=[RuntimeError("session lost")] * 100)
+    assert not BasePage(drv).is_absent("id", "x", timeout=0, stable_for=0.2, poll=0.01)
+
+    # an error inside the stability window restarts it
+    drv = FakeSettingsDriver(lookups=[[], RuntimeError("session lost")])
+    page = BasePage(drv)
+    assert page.is_absent("id", "x", timeout=1, stable_for=0.05, poll=0.01)
+    assert drv.lookups == []